@@ -1,7 +1,8 @@
 """Interactive CLI UI module for key selection."""
-import sys
 import os
-from typing import List, Set, Dict
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Set, Dict
 
 # Windows console support
 if sys.platform == 'win32':
@@ -17,59 +18,220 @@ class CLIUI:
     def __init__(self):
         """Initialize CLI UI."""
         self.selected_indices: Set[int] = set()
-        self.ordered_selection: Dict[int, int] = {}  # Maps index to selection order
+        self._order_list: List[int] = []  # Selected indices in selection order
         self.current_index: int = 0
-    
+        self._prev_frame: List[str] = []  # Last rendered frame for diffing
+        self._raw_active: bool = False
+        self._saved_termios = None
+        self._key_buf = bytearray()  # Unconsumed stdin bytes (Unix)
+
+        if sys.platform == 'win32':
+            self._enable_windows_vt_mode()
+
+    def _enable_windows_vt_mode(self) -> None:
+        """Enable ANSI escape sequence processing in the Windows console."""
+        try:
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+            STD_OUTPUT_HANDLE = -11
+
+            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+            mode = ctypes.c_uint32()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                kernel32.SetConsoleMode(
+                    handle,
+                    mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                )
+        except Exception:
+            # Older consoles without VT support still work, just without
+            # escape-based clearing
+            pass
+
     def clear_screen(self) -> None:
-        """Clear terminal screen."""
-        os.system('cls' if sys.platform == 'win32' else 'clear')
-    
+        """Clear terminal screen with ANSI escapes (no shell subprocess)."""
+        sys.stdout.write('\x1b[H\x1b[2J')
+        sys.stdout.flush()
+        self._prev_frame = []
+
+    def _render_frame(self, lines: List[str]) -> None:
+        """
+        Render a frame, emitting only the lines that changed.
+
+        Compares against the previously rendered frame and rewrites just
+        the differing lines with cursor-addressing escapes, so a typical
+        keypress (cursor move or checkbox toggle) redraws one or two
+        lines instead of the whole screen.
+
+        Args:
+            lines: Rendered frame as a list of lines (without newlines)
+        """
+        prev = self._prev_frame
+
+        # No-op keys (e.g. unrecognized input) produce an identical
+        # frame; skip the terminal round-trip entirely in that case
+        if lines == prev:
+            return
+
+        # Assemble the whole frame update and emit it with one write,
+        # so each redraw costs a single syscall
+        buf = []
+
+        if not prev:
+            # First frame after a clear: draw everything
+            buf.append('\x1b[H\x1b[2J')
+        else:
+            buf.append('\x1b[H')
+
+        for i, line in enumerate(lines):
+            if i >= len(prev) or prev[i] != line:
+                buf.append(f'\x1b[{i + 1};1H\x1b[2K{line}')
+
+        # Erase leftover lines from a taller previous frame
+        for i in range(len(lines), len(prev)):
+            buf.append(f'\x1b[{i + 1};1H\x1b[2K')
+
+        sys.stdout.write(''.join(buf))
+        sys.stdout.flush()
+        self._prev_frame = lines
+
+
+    @contextmanager
+    def _raw_mode(self) -> Iterator[None]:
+        """
+        Keep the terminal in raw mode for the duration of a selection loop.
+
+        Entering raw mode once per loop (instead of per keypress) saves a
+        tcgetattr/tcsetattr syscall pair on every key and avoids the
+        TCSADRAIN output wait. No-op on Windows and when stdin is not a
+        terminal (e.g. under tests).
+        """
+        if sys.platform == 'win32' or not sys.stdin.isatty():
+            yield
+            return
+
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        self._raw_active = True
+        self._saved_termios = saved
+        try:
+            yield
+        finally:
+            self._raw_active = False
+            self._saved_termios = None
+            termios.tcsetattr(fd, termios.TCSANOW, saved)
+
+    def _cooked_input(self, prompt: str) -> str:
+        """
+        Read a line with the terminal temporarily restored to cooked mode.
+
+        Args:
+            prompt: Prompt to display
+
+        Returns:
+            The line entered by the user
+        """
+        if self._raw_active and self._saved_termios is not None:
+            fd = sys.stdin.fileno()
+            termios.tcsetattr(fd, termios.TCSANOW, self._saved_termios)
+            try:
+                return input(prompt)
+            finally:
+                tty.setraw(fd)
+        return input(prompt)
+
     def _get_key(self) -> str:
         """
         Get single keypress from user (blocking).
-        
+
         Returns:
             Key code as string
         """
         if sys.platform == 'win32':
-            # Windows - blocking wait for keypress
-            while True:
-                first = msvcrt.getch()
-                if first in (b'\x00', b'\xe0'):  # Arrow keys
-                    second = msvcrt.getch()
-                    if second == b'H':
-                        return 'up'
-                    elif second == b'P':
-                        return 'down'
-                elif first == b'\r':  # Enter
-                    return 'enter'
-                elif first == b' ':  # Space
-                    return 'space'
-                elif first == b'\x1b':  # Escape
-                    return 'escape'
-                # Ignore other keys and continue waiting
+            # Windows - block for the first byte, then drain whatever
+            # else is already buffered (multi-byte sequences, pasted
+            # input) in one burst instead of re-entering per byte
+            buf = bytearray(msvcrt.getch())
+            while msvcrt.kbhit():
+                buf.extend(msvcrt.getch())
+
+            if buf[0] in (0x00, 0xe0):  # Arrow keys
+                if buf[1:2] == b'H':
+                    return 'up'
+                elif buf[1:2] == b'P':
+                    return 'down'
+            elif buf[0:1] == b'\r':  # Enter
+                return 'enter'
+            elif buf[0:1] == b' ':  # Space
+                return 'space'
+            elif buf[0:1] == b'\x1b':  # Escape
+                return 'escape'
+            # Unknown burst: let the caller re-poll
+            return ''
         else:
             # Unix-like
             fd = sys.stdin.fileno()
+
+            if self._raw_active:
+                # Raw mode is held by the enclosing _raw_mode() block;
+                # just read
+                return self._read_key_unix()
+
+            # Standalone call: enter and restore raw mode around the read
             old_settings = termios.tcgetattr(fd)
             try:
                 tty.setraw(fd)
-                ch = sys.stdin.read(1)
-                if ch == '\x1b':  # Escape sequence
-                    ch2 = sys.stdin.read(1)
-                    if ch2 == '[':
-                        ch3 = sys.stdin.read(1)
-                        if ch3 == 'A':
-                            return 'up'
-                        elif ch3 == 'B':
-                            return 'down'
-                elif ch == '\r' or ch == '\n':
-                    return 'enter'
-                elif ch == ' ':
-                    return 'space'
+                return self._read_key_unix()
             finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                termios.tcsetattr(fd, termios.TCSANOW, old_settings)
+
+    def _read_key_unix(self) -> str:
+        """
+        Read and decode one keypress from raw-mode stdin (Unix).
+
+        Reads up to 8 bytes in a single os.read so a multi-byte escape
+        sequence (arrow keys) costs one syscall instead of three. Under
+        key auto-repeat one read can deliver several sequences, so
+        unconsumed bytes are kept in a buffer and exactly one sequence
+        is taken per call; a fresh read happens only when the buffer is
+        empty.
+
+        Returns:
+            Key code as string, or '' for unrecognized input
+        """
+        buf = self._key_buf
+        if not buf:
+            buf += os.read(sys.stdin.fileno(), 8)
+
+        if buf[:1] == b'\x1b':
+            if buf[1:2] == b'[':
+                # CSI sequence: the final byte always follows, so top
+                # up if the read split the sequence
+                while len(buf) < 3:
+                    data = os.read(sys.stdin.fileno(), 8)
+                    if not data:
+                        break
+                    buf += data
+                final = buf[2:3]
+                del buf[:3]
+                if final == b'A':
+                    return 'up'
+                if final == b'B':
+                    return 'down'
+                return ''
+            # Lone escape (or unknown sequence start): drop one byte
+            del buf[:1]
             return ''
+
+        c = bytes(buf[:1])
+        del buf[:1]
+        if c in (b'\r', b'\n'):
+            return 'enter'
+        if c == b' ':
+            return 'space'
+        return ''
     
     def select_keys(self, keys: List[str], title: str = "Select CSV columns to include:") -> List[str]:
         """
@@ -88,40 +250,48 @@ class CLIUI:
         # Initialize all as selected by default
         self.selected_indices = set(range(len(keys)))
         self.current_index = 0
-        
-        while True:
-            self.clear_screen()
-            
-            # Print title
-            print(f"\n{title}\n")
-            print("Use ↑/↓ to navigate, SPACE to toggle, ENTER to confirm\n")
-            
-            # Print options
-            for i, key in enumerate(keys):
-                cursor = "→" if i == self.current_index else " "
-                checkbox = "[✓]" if i in self.selected_indices else "[ ]"
-                print(f"{cursor} {checkbox} {key}")
-            
-            print(f"\nSelected: {len(self.selected_indices)}/{len(keys)}")
-            
-            # Get user input (blocks until valid key pressed)
-            key = self._get_key()
-            
-            if key == 'up':
-                self.current_index = (self.current_index - 1) % len(keys)
-            elif key == 'down':
-                self.current_index = (self.current_index + 1) % len(keys)
-            elif key == 'space':
-                if self.current_index in self.selected_indices:
-                    self.selected_indices.remove(self.current_index)
-                else:
-                    self.selected_indices.add(self.current_index)
-            elif key == 'enter':
-                if self.selected_indices:
-                    return [keys[i] for i in sorted(self.selected_indices)]
-                else:
-                    print("\n⚠ You must select at least one column!")
-                    input("Press Enter to continue...")
+        self._prev_frame = []
+
+        with self._raw_mode():
+            while True:
+                # Build the frame and let the diff renderer emit changes
+                frame = [
+                    "",
+                    title,
+                    "",
+                    "Use ↑/↓ to navigate, SPACE to toggle, ENTER to confirm",
+                    "",
+                ]
+
+                for i, key in enumerate(keys):
+                    cursor = "→" if i == self.current_index else " "
+                    checkbox = "[✓]" if i in self.selected_indices else "[ ]"
+                    frame.append(f"{cursor} {checkbox} {key}")
+
+                frame.append("")
+                frame.append(f"Selected: {len(self.selected_indices)}/{len(keys)}")
+
+                self._render_frame(frame)
+
+                # Get user input (blocks until valid key pressed)
+                key = self._get_key()
+
+                if key == 'up':
+                    self.current_index = (self.current_index - 1) % len(keys)
+                elif key == 'down':
+                    self.current_index = (self.current_index + 1) % len(keys)
+                elif key == 'space':
+                    if self.current_index in self.selected_indices:
+                        self.selected_indices.remove(self.current_index)
+                    else:
+                        self.selected_indices.add(self.current_index)
+                elif key == 'enter':
+                    if self.selected_indices:
+                        return [keys[i] for i in sorted(self.selected_indices)]
+                    else:
+                        print("\n⚠ You must select at least one column!")
+                        self._cooked_input("Press Enter to continue...")
+                        self._prev_frame = []
     
     def wait_for_enter(self, message: str = "Press ENTER to continue...") -> None:
         """
@@ -160,72 +330,71 @@ class CLIUI:
             return []
         
         # Reset selection state - start with nothing selected
-        self.ordered_selection = {}
+        self._order_list = []
         self.current_index = 0
-        next_order_number = 1
-        
-        while True:
-            self.clear_screen()
-            
-            # Print title and instructions
-            print(f"\n{title}\n")
-            print("Use ↑/↓ to navigate, SPACE to toggle (order matters), ENTER to confirm")
-            print("Selected keys will be used to build the filename in order\n")
-            
-            # Print options with order indicators
-            for i, key in enumerate(keys):
-                cursor = "→" if i == self.current_index else " "
-                
-                # Show order number if selected
-                if i in self.ordered_selection:
-                    order_num = self.ordered_selection[i]
-                    checkbox = f"[{order_num}]"
-                else:
-                    checkbox = "[ ]"
+        self._prev_frame = []
+
+        with self._raw_mode():
+            while True:
+                # Build the frame and let the diff renderer emit changes
+                frame = [
+                    "",
+                    title,
+                    "",
+                    "Use ↑/↓ to navigate, SPACE to toggle (order matters), ENTER to confirm",
+                    "Selected keys will be used to build the filename in order",
+                    "",
+                ]
+
+                # One-based order numbers, computed once per frame
+                # instead of a list scan per displayed key
+                order_map = {idx: n for n, idx in enumerate(self._order_list, 1)}
+
+                # Options with order indicators
+                for i, key in enumerate(keys):
+                    cursor = "→" if i == self.current_index else " "
+
+                    # Show order number if selected (position in the
+                    # selection list determines the order)
+                    order = order_map.get(i)
+                    checkbox = f"[{order}]" if order else "[ ]"
+
+                    frame.append(f"{cursor} {checkbox} {key}")
+
+                # Current selection count and preview
+                selected_count = len(self._order_list)
+                frame.append("")
+                frame.append(f"Selected: {selected_count}/{len(keys)}")
+
+                # Show filename preview if any keys are selected
+                if self._order_list:
+                    frame.append("")
+                    frame.append("Filename preview:")
+                    preview_parts = [f"<{keys[idx]}>" for idx in self._order_list]
+                    frame.append(f"  {' - '.join(preview_parts)}")
+
+                self._render_frame(frame)
+
+                # Get user input (blocks until valid key pressed)
+                key_press = self._get_key()
                 
-                print(f"{cursor} {checkbox} {key}")
-            
-            # Display current selection count and preview
-            selected_count = len(self.ordered_selection)
-            print(f"\nSelected: {selected_count}/{len(keys)}")
-            
-            # Show filename preview if any keys are selected
-            if self.ordered_selection:
-                print("\nFilename preview:")
-                ordered_keys = sorted(self.ordered_selection.items(), key=lambda x: x[1])
-                preview_parts = [f"<{keys[idx]}>" for idx, _ in ordered_keys]
-                print(f"  {' - '.join(preview_parts)}")
-            
-            # Get user input (blocks until valid key pressed)
-            key_press = self._get_key()
-            
-            if key_press == 'up':
-                self.current_index = (self.current_index - 1) % len(keys)
-            elif key_press == 'down':
-                self.current_index = (self.current_index + 1) % len(keys)
-            elif key_press == 'space':
-                if self.current_index in self.ordered_selection:
-                    # Deselect: remove and recalculate order numbers
-                    removed_order = self.ordered_selection[self.current_index]
-                    del self.ordered_selection[self.current_index]
-                    
-                    # Recalculate order numbers for remaining selections
-                    for idx in self.ordered_selection:
-                        if self.ordered_selection[idx] > removed_order:
-                            self.ordered_selection[idx] -= 1
-                    
-                    # Update next order number
-                    next_order_number = len(self.ordered_selection) + 1
-                else:
-                    # Select: assign next order number
-                    self.ordered_selection[self.current_index] = next_order_number
-                    next_order_number += 1
-            elif key_press == 'enter':
-                if self.ordered_selection:
-                    # Return keys in selection order
-                    ordered_indices = sorted(self.ordered_selection.items(), key=lambda x: x[1])
-                    return [keys[idx] for idx, _ in ordered_indices]
-                else:
-                    print("\n⚠ You must select at least one key for the filename!")
-                    input("Press Enter to continue...")
+                if key_press == 'up':
+                    self.current_index = (self.current_index - 1) % len(keys)
+                elif key_press == 'down':
+                    self.current_index = (self.current_index + 1) % len(keys)
+                elif key_press == 'space':
+                    if self.current_index in self._order_list:
+                        # Deselect: later selections shift up implicitly
+                        self._order_list.remove(self.current_index)
+                    else:
+                        # Select: append at the end of the order
+                        self._order_list.append(self.current_index)
+                elif key_press == 'enter':
+                    if self._order_list:
+                        # Return keys in selection order
+                        return [keys[idx] for idx in self._order_list]
+                    else:
+                        print("\n⚠ You must select at least one key for the filename!")
+                        self._cooked_input("Press Enter to continue...")
+                        self._prev_frame = []
 
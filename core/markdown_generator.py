@@ -1,10 +1,71 @@
 """Markdown file generation with YAML frontmatter."""
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 import yaml
 
+# Prefer the libyaml-backed dumper so YAML emission runs in C;
+# fall back to the pure-Python dumper when libyaml is unavailable
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 from utils.filename_generator import FilenameGenerator
 
+# Frontmatter delimiter, encoded once for the raw write path
+_FM_DELIM = b"---\n"
+
+# Values made up entirely of these characters are plain YAML scalars that
+# need no quoting or escaping, so they can be emitted as "key: value"
+# directly without going through the YAML emitter. Leading '-', '.' or a
+# digit is handled separately: those can resolve as block-sequence
+# markers or numbers (e.g. "007" would parse back as 7).
+_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z0-9 _./\-]*')
+
+# Words the YAML 1.1 resolver turns into booleans or null; emitting
+# them bare would change their type on load ("no" becomes False)
+_AMBIGUOUS_PLAIN = frozenset((
+    'y', 'n', 'yes', 'no', 'true', 'false', 'on', 'off', 'null',
+))
+
+# Control characters (other than tab) cannot survive YAML single
+# quotes: most are rejected outright, and the ones YAML does accept
+# (NEL, LS, PS) are parsed as line breaks, changing the value. All of
+# them must go through the full emitter, which double-quote-escapes
+# them.
+_CTRL_SCALAR_RE = re.compile(r'[\x00-\x08\x0a-\x1f\x7f-\x9f\u2028\u2029]')
+
+
+def _yaml_scalar(value: str) -> Optional[str]:
+    """
+    Format a string as a YAML scalar without the YAML emitter.
+
+    Plain values pass through bare; anything the YAML resolver would
+    read back as a non-string (numbers, booleans, null words) gets
+    single-quoted with embedded quotes doubled, like everything else
+    outside the plain character set. Values with control characters
+    (newlines, escapes) return None so the caller can fall back to
+    yaml.dump for correct escaping.
+
+    Args:
+        value: String value to format
+
+    Returns:
+        YAML scalar text, or None if the value needs the full emitter
+    """
+    if not value:
+        return "''"
+    if (value[0] not in '-.0123456789'
+            and value.lower() not in _AMBIGUOUS_PLAIN
+            and _PLAIN_SCALAR_RE.fullmatch(value)):
+        return value
+    if _CTRL_SCALAR_RE.search(value):
+        return None
+    return "'" + value.replace("'", "''") + "'"
+
 
 class MarkdownGenerationError(Exception):
     """Raised when markdown generation fails."""
@@ -40,6 +101,41 @@ class MarkdownGenerator:
         self.selected_keys = selected_keys
         self.naming_keys = naming_keys if naming_keys else []
         self.files_created = 0
+
+        # Frontmatter key order is fixed for the life of the generator;
+        # reuse one dict per row instead of allocating a fresh one.
+        # Safe because content is built serially (only writes are
+        # parallelized) and yaml.dump consumes the dict before returning.
+        self._keys_tuple = tuple(selected_keys)
+        self._frontmatter_buf: Dict[str, Any] = {k: '' for k in self._keys_tuple}
+
+        # Reusable byte buffer for rendering. Rows are rendered serially
+        # and each render returns an immutable bytes copy, so one buffer
+        # serves the whole run instead of a parts list per row.
+        self._render_buf = bytearray()
+
+        # The "key: " prefixes never change for a run, so format and
+        # encode them once through the same scalar rules as values —
+        # keys like "no" or "007" must stay quoted or they load back as
+        # non-string keys. A key the scalar formatter can't handle
+        # disables the fast path entirely.
+        key_scalars = [_yaml_scalar(k) for k in self._keys_tuple]
+        self._keys_are_plain = all(s is not None for s in key_scalars)
+        self._key_prefixes = tuple(
+            f"{s}: ".encode('utf-8') for s in key_scalars if s is not None
+        )
+
+        # Hold the output directory open so per-file opens resolve only
+        # the child name instead of the full path (openat semantics).
+        # Not available on Windows.
+        if hasattr(os, 'O_DIRECTORY'):
+            self._dir_fd: Optional[int] = os.open(str(self.output_dir), os.O_DIRECTORY)
+        else:
+            self._dir_fd = None
+
+        # Precomputed string prefix for the non-dir_fd path, so per-file
+        # targets are one string concat instead of two Path allocations
+        self._out_prefix = str(self.output_dir).rstrip('/\\') + os.sep
         
         # Initialize filename generator if naming keys are provided
         if self.naming_keys:
@@ -47,97 +143,162 @@ class MarkdownGenerator:
         else:
             self.filename_generator = None
     
-    def _escape_yaml_value(self, value: Any) -> Any:
+    def _render_markdown(self, row: Dict[str, Any]) -> bytes:
         """
-        Escape value for YAML if needed.
-        
-        Args:
-            value: Value to escape
-            
-        Returns:
-            Escaped value
-        """
-        if value is None or value == '':
-            return ''
-        
-        value_str = str(value).strip()
-        
-        # Check if value needs quoting
-        if not value_str:
-            return ''
-        
-        # Let PyYAML handle the escaping
-        return value_str
-    
-    def _create_frontmatter(self, row: Dict[str, Any]) -> str:
-        """
-        Create YAML frontmatter from row data.
-        
+        Render the complete markdown file content for a row.
+
         Args:
             row: Data row
-            
+
         Returns:
-            YAML frontmatter string
+            Encoded file content, delimiters included
         """
-        # Build frontmatter dict
-        frontmatter = {}
-        for key in self.selected_keys:
-            value = row.get(key, '')
-            frontmatter[key] = self._escape_yaml_value(value)
-        
+        # Fast path: emit the pre-encoded "key: " prefix plus a
+        # hand-formatted scalar for each value, skipping the YAML
+        # emitter. Only multiline values (or non-string data) force the
+        # yaml.dump fallback. Values arrive from CSVParser already
+        # stripped, so no per-cell normalization is needed here.
+        if self._keys_are_plain:
+            buf = self._render_buf
+            buf.clear()
+            buf += _FM_DELIM
+            for key, prefix in zip(self._keys_tuple, self._key_prefixes):
+                value = row.get(key, '')
+                if not isinstance(value, str):
+                    break
+                scalar = _yaml_scalar(value)
+                if scalar is None:
+                    break
+                buf += prefix
+                buf += scalar.encode('utf-8')
+                buf += b"\n"
+            else:
+                buf += _FM_DELIM
+                return bytes(buf)
+
+        # Fill the reusable frontmatter dict straight from the row;
+        # CSVParser guarantees stripped string values
+        frontmatter = self._frontmatter_buf
+        for key in self._keys_tuple:
+            frontmatter[key] = row.get(key, '')
+
         # Convert to YAML
         yaml_content = yaml.dump(
             frontmatter,
+            Dumper=_YamlDumper,
             allow_unicode=True,
             default_flow_style=False,
             sort_keys=False
         )
-        
-        return f"---\n{yaml_content}---\n"
-    
-    def generate_files(self, rows: List[Dict[str, Any]]) -> int:
+
+        return _FM_DELIM + yaml_content.encode('utf-8') + _FM_DELIM
+
+    def _write_markdown(self, file_name: str, content: bytes) -> None:
+        """
+        Write a markdown file with a single raw write.
+
+        Opens the target relative to the held directory fd when
+        available, so the kernel resolves only the child name, and emits
+        the pre-assembled content in one os.write call.
+
+        Args:
+            file_name: Target filename (relative to the output directory)
+            content: Complete encoded file content
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        if self._dir_fd is not None:
+            fd = os.open(file_name, flags, 0o644, dir_fd=self._dir_fd)
+        else:
+            fd = os.open(self._out_prefix + file_name, flags, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+
+    def _write_one(self, task: Tuple[str, bytes]) -> int:
+        """
+        Write a single markdown file (thread pool worker).
+
+        Args:
+            task: (file_name, content) pair
+
+        Returns:
+            1, so the caller can sum successes
+        """
+        file_name, content = task
+        self._write_markdown(file_name, content)
+        return 1
+
+    def close(self) -> None:
+        """Release the output directory file descriptor."""
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def generate_files(self, rows: Iterable[Dict[str, Any]]) -> int:
         """
         Generate markdown files for all rows.
-        
+
+        Rows may be any iterable (e.g. CSVParser.iter_rows()), so large
+        CSVs can stream through without being held in memory.
+
         Args:
-            rows: List of data rows
-            
+            rows: Iterable of data rows
+
         Returns:
             Number of files created
-            
+
         Raises:
-            MarkdownGenerationError: If generation fails
+            MarkdownGenerationError: If generation fails or rows is empty
         """
-        if not rows:
-            raise MarkdownGenerationError("No rows to generate")
-        
         self.files_created = 0
-        
+
         # Use FilenameGenerator if available, otherwise use legacy method
         if self.filename_generator:
             # Reset generator state for new batch
             self.filename_generator.reset()
-            
+
+            # Filename generation stays serial because the generator
+            # holds collision state; only the writes are parallelized
+            tasks: List[Tuple[str, bytes]] = []
             for row_index, row in enumerate(rows):
                 try:
                     # Generate unique filename using the filename generator
                     filename = self.filename_generator.generate_filename(row, row_index)
-                    
-                    # Create full path
-                    file_path = self.output_dir / f"{filename}.md"
-                    
+
                     # Generate content
-                    content = self._create_frontmatter(row)
-                    
-                    # Write file
-                    file_path.write_text(content, encoding='utf-8')
-                    self.files_created += 1
-                    
+                    content = self._render_markdown(row)
+
+                    tasks.append((f"{filename}.md", content))
+
                 except Exception as e:
                     raise MarkdownGenerationError(f"Failed to generate file for row {row_index + 1}: {e}")
+
+            if tasks:
+                # File writes release the GIL inside open/write, so a
+                # thread pool hides per-file syscall latency
+                max_workers = min(32, (os.cpu_count() or 1) * 4)
+                try:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        self.files_created = sum(
+                            executor.map(self._write_one, tasks, chunksize=64)
+                        )
+                except MarkdownGenerationError:
+                    raise
+                except Exception as e:
+                    raise MarkdownGenerationError(f"Failed to write markdown files: {e}")
         else:
             raise MarkdownGenerationError("No naming keys provided - cannot generate filenames")
-        
+
+        if self.files_created == 0:
+            raise MarkdownGenerationError("No rows to generate")
+
         return self.files_created
     
     def get_files_created(self) -> int:
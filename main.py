@@ -39,8 +39,7 @@ def main():
         try:
             parser = CSVParser(csv_file)
             headers = parser.get_headers()
-            rows = parser.get_rows()
-            print(f"✓ Loaded {len(rows)} rows with {len(headers)} columns")
+            print(f"✓ Loaded {parser.get_row_count()} rows with {len(headers)} columns")
         except (FileNotFoundError, CSVParseError) as e:
             print(f"\n❌ Error: {e}")
             return 1
@@ -94,7 +93,7 @@ def main():
         print("\nStep 6: Generating Markdown files...")
         try:
             generator = MarkdownGenerator(output_dir, selected_keys, naming_keys)
-            files_created = generator.generate_files(rows)
+            files_created = generator.generate_files(parser.iter_rows())
             
             # Step 7: Completion
             ui.clear_screen()
@@ -44,6 +44,100 @@ def test_csv_parser_rejects_missing_file():
         CSVParser("nonexistent.csv")
 
 
+def test_csv_parser_iter_rows_matches_get_rows(tmp_path):
+    """Test that streaming iteration yields the same rows as get_rows."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("name,age,city\nAlice,30,NYC\nBob,25,LA")
+
+    parser = CSVParser(str(csv_file))
+
+    assert list(parser.iter_rows()) == parser.get_rows()
+
+
+def test_csv_parser_custom_delimiter(tmp_path):
+    """Test parsing with a non-default delimiter."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("name;age\nAlice;30\nBob;25")
+
+    parser = CSVParser(str(csv_file), delimiter=';')
+
+    assert parser.get_headers() == ["name", "age"]
+    assert parser.get_rows() == [
+        {"name": "Alice", "age": "30"},
+        {"name": "Bob", "age": "25"},
+    ]
+
+
+def test_csv_parser_row_count_without_trailing_newline(tmp_path):
+    """Test row counting when the file doesn't end in a newline."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("name,age\nAlice,30\nBob,25")
+
+    parser = CSVParser(str(csv_file))
+
+    assert parser.get_row_count() == 2
+
+
+def test_csv_parser_row_count_with_multiline_values(tmp_path):
+    """Test that quoted multiline cells don't inflate the row count."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text('name,note\nAlice,"line1\nline2"\nBob,ok\n')
+
+    parser = CSVParser(str(csv_file))
+    rows = list(parser.iter_rows())
+
+    assert len(rows) == 2
+    assert rows[0]["note"] == "line1\nline2"
+    assert parser.get_row_count() == 2
+
+
+def test_csv_parser_skips_blank_lines(tmp_path):
+    """Test that blank lines yield no rows and aren't counted."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("name,age\nAlice,30\n\nBob,25\n")
+
+    parser = CSVParser(str(csv_file))
+    rows = list(parser.iter_rows())
+
+    assert len(rows) == 2
+    assert [row["name"] for row in rows] == ["Alice", "Bob"]
+    assert parser.get_row_count() == 2
+
+
+def test_csv_parser_pyarrow_path_matches_stdlib(tmp_path):
+    """Test that the pyarrow fast path yields the same rows as stdlib."""
+    pytest.importorskip("pyarrow.csv")
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("id,name,active\n007,Alice,no\n012,Bob,yes")
+
+    parser = CSVParser(str(csv_file))
+
+    pyarrow_rows = list(parser._iter_rows_pyarrow())
+    stdlib_rows = list(parser._iter_rows_stdlib())
+
+    assert pyarrow_rows == stdlib_rows
+    # Leading zeros and yes/no values must survive as strings
+    assert pyarrow_rows[0]["id"] == "007"
+    assert pyarrow_rows[0]["active"] == "no"
+
+
+def test_csv_parser_pyarrow_path_handles_ragged_rows(tmp_path):
+    """Test that ragged rows don't make the paths diverge."""
+    pytest.importorskip("pyarrow.csv")
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("a,b\n1,2,3\n4\n")
+
+    parser = CSVParser(str(csv_file))
+
+    stdlib_rows = list(parser._iter_rows_stdlib())
+
+    assert list(parser._iter_rows_pyarrow()) == stdlib_rows
+    assert stdlib_rows == [
+        {"a": "1", "b": "2"},
+        {"a": "4", "b": ""},
+    ]
+
+
 def test_csv_parser_rejects_no_data(tmp_path):
     """Test parser rejects CSV with headers but no data."""
     csv_file = tmp_path / "test.csv"
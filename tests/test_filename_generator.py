@@ -171,6 +171,64 @@ def test_filename_generator_reset(tmp_path):
     assert filename2 == "Test"
 
 
+def test_filename_generator_bulk_matches_per_row(tmp_path):
+    """Test that bulk generation matches per-row generation."""
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    naming_keys = ["department", "name"]
+    rows = [
+        {"department": "Engineering", "name": "Alice"},
+        {"department": "Engineering", "name": "Alice"},
+        {"department": "", "name": ""},
+        {"department": "Sales", "name": "Bob<bad>"},
+    ]
+
+    per_row = FilenameGenerator(naming_keys, output_dir)
+    expected = [per_row.generate_filename(row, i) for i, row in enumerate(rows)]
+
+    bulk = FilenameGenerator(naming_keys, output_dir)
+
+    assert list(bulk.generate_filenames_bulk(rows)) == expected
+
+
+def test_filename_generator_dataframe_matches_bulk(tmp_path):
+    """Test that DataFrame generation matches the row-dict paths."""
+    pd = pytest.importorskip("pandas")
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    naming_keys = ["department", "name"]
+    rows = [
+        {"department": "Engineering", "name": "Alice"},
+        {"department": "Engineering", "name": "Alice"},
+        {"department": "", "name": ""},
+        {"department": "Sales", "name": "Bob<bad>"},
+    ]
+
+    bulk = FilenameGenerator(naming_keys, output_dir)
+    expected = list(bulk.generate_filenames_bulk(rows))
+
+    df_generator = FilenameGenerator(naming_keys, output_dir)
+    result = df_generator.generate_filenames_df(pd.DataFrame(rows))
+
+    assert list(result) == expected
+
+
+def test_filename_generator_refresh_disk_cache(tmp_path):
+    """Test that refresh_disk_cache picks up files created externally."""
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    generator = FilenameGenerator(["name"], output_dir)
+
+    # File appears after the generator took its snapshot
+    (output_dir / "Report.md").touch()
+    generator.refresh_disk_cache()
+
+    assert generator.generate_filename({"name": "Report"}, 0) == "Report - 2"
+
+
 def test_filename_generator_multiple_ordered_keys(tmp_path):
     """Test filename generation with multiple ordered keys in specific sequence."""
     output_dir = tmp_path / "output"
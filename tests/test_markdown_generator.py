@@ -1,7 +1,65 @@
 """Test suite for markdown generator."""
 import pytest
+import yaml
 from pathlib import Path
-from core.markdown_generator import MarkdownGenerator, MarkdownGenerationError
+from core.markdown_generator import MarkdownGenerator, MarkdownGenerationError, _yaml_scalar
+
+
+def test_yaml_scalar_preserves_value_types():
+    """Test that emitted scalars load back as the original strings."""
+    values = [
+        "no", "Yes", "TRUE", "off", "null", "n",
+        "007", "30", "1.5", ".5", "2024-01-15",
+        "Alice", "hello world", "O'Brien", "[tagged]",
+    ]
+
+    for value in values:
+        scalar = _yaml_scalar(value)
+        assert scalar is not None
+        assert yaml.safe_load(f"key: {scalar}")["key"] == value
+
+
+def test_yaml_scalar_rejects_control_characters():
+    """Test that control characters defer to the full YAML emitter."""
+    for value in ["line1\nline2", "a\rb", "esc\x1bseq", "bell\x07",
+                  "del\x7fchar", "c1\x9fctrl", "nel\x85break",
+                  "ls\u2028break"]:
+        assert _yaml_scalar(value) is None
+
+    # Tab is legal inside single quotes and should not force a fallback
+    assert _yaml_scalar("a\tb") is not None
+
+
+def test_markdown_generator_quotes_ambiguous_keys(tmp_path):
+    """Test that YAML-ambiguous column names load back as string keys."""
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    rows = [{"no": "x", "007": "y", "name": "Alice"}]
+
+    generator = MarkdownGenerator(str(output_dir), ["no", "007", "name"], ["name"])
+    generator.generate_files(rows)
+
+    content = (output_dir / "Alice.md").read_text()
+    frontmatter = yaml.safe_load(content.split("---")[1])
+
+    assert frontmatter == {"no": "x", "007": "y", "name": "Alice"}
+
+
+def test_markdown_generator_control_characters_round_trip(tmp_path):
+    """Test that frontmatter with control characters still loads."""
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    rows = [{"name": "Alice", "note": "esc\x1bseq"}]
+
+    generator = MarkdownGenerator(str(output_dir), ["name", "note"], ["name"])
+    generator.generate_files(rows)
+
+    content = (output_dir / "Alice.md").read_text()
+    frontmatter = yaml.safe_load(content.split("---")[1])
+
+    assert frontmatter["note"] == "esc\x1bseq"
 
 
 def test_markdown_generator_creates_files(tmp_path):
@@ -1,81 +1,176 @@
 """Windows file and folder picker utilities."""
 import sys
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, Tuple
 from pathlib import Path
 
+# Cached pywin32 module handles, populated on first dialog use so CLI
+# startup never pays the import and repeat dialogs skip the re-import
+_win32_modules: Optional[Tuple] = None
 
-def pick_csv_file() -> Optional[str]:
+
+def _load_win32() -> Tuple:
     """
-    Open Windows file picker for CSV file selection.
-    
+    Import and cache the pywin32 dialog modules (once per process).
+
+    Returns:
+        Tuple of (pythoncom, win32gui, win32con, shell, shellcon)
+
+    Raises:
+        RuntimeError: If pywin32 is not installed
+    """
+    global _win32_modules
+    if _win32_modules is None:
+        try:
+            import pythoncom
+            import win32gui
+            import win32con
+            from win32com.shell import shell, shellcon
+        except ImportError:
+            raise RuntimeError("pywin32 is required for Windows file dialogs")
+        _win32_modules = (pythoncom, win32gui, win32con, shell, shellcon)
+    return _win32_modules
+
+
+def _pick_csv_file_dialog() -> Optional[str]:
+    """
+    Show the CSV file dialog (must run on a COM-initialized thread).
+
     Returns:
         Selected file path or None if cancelled
     """
-    if sys.platform != 'win32':
-        raise RuntimeError("This application only works on Windows")
-    
+    _, win32gui, win32con, _, _ = _load_win32()
+
+    # Create file dialog
+    filters = "CSV Files (*.csv)\0*.csv\0All Files (*.*)\0*.*\0"
+    flags = (
+        win32con.OFN_EXPLORER |
+        win32con.OFN_FILEMUSTEXIST |
+        win32con.OFN_HIDEREADONLY
+    )
+
     try:
-        import win32gui
-        import win32con
-        
-        # Create file dialog
-        filters = "CSV Files (*.csv)\0*.csv\0All Files (*.*)\0*.*\0"
-        custom_filter = None
-        file_name = None
-        flags = (
-            win32con.OFN_EXPLORER |
-            win32con.OFN_FILEMUSTEXIST |
-            win32con.OFN_HIDEREADONLY
+        file_name, custom_filter, flags = win32gui.GetOpenFileNameW(
+            InitialDir=str(Path.home()),
+            Flags=flags,
+            Filter=filters,
+            Title="Select CSV File"
         )
-        
-        try:
-            file_name, custom_filter, flags = win32gui.GetOpenFileNameW(
-                InitialDir=str(Path.home()),
-                Flags=flags,
-                Filter=filters,
-                Title="Select CSV File"
-            )
-        except Exception:
-            # User cancelled
-            return None
-        
-        if file_name:
-            return file_name
+    except Exception:
+        # User cancelled
         return None
-        
-    except ImportError:
-        raise RuntimeError("pywin32 is required for Windows file dialogs")
 
+    if file_name:
+        return file_name
+    return None
 
-def pick_folder() -> Optional[str]:
+
+def _pick_folder_dialog() -> Optional[str]:
     """
-    Open Windows folder picker for output directory selection.
-    
+    Show the folder dialog (must run on a COM-initialized thread).
+
+    Uses the native IFileDialog in folder-picking mode rather than
+    spinning up (and tearing down) a hidden Tk root window, which is
+    slow to initialize and prone to COM-threading conflicts.
+
     Returns:
         Selected folder path or None if cancelled
     """
+    pythoncom, _, _, shell, shellcon = _load_win32()
+
+    dialog = pythoncom.CoCreateInstance(
+        shell.CLSID_FileOpenDialog,
+        None,
+        pythoncom.CLSCTX_INPROC_SERVER,
+        shell.IID_IFileOpenDialog
+    )
+    dialog.SetTitle("Select Output Folder")
+    dialog.SetOptions(
+        dialog.GetOptions()
+        | shellcon.FOS_PICKFOLDERS
+        | shellcon.FOS_FORCEFILESYSTEM
+    )
+
+    try:
+        dialog.Show(0)
+    except Exception:
+        # User cancelled
+        return None
+
+    item = dialog.GetResult()
+    return item.GetDisplayName(shellcon.SIGDN_FILESYSPATH)
+
+
+def _run_dialog(dialog_fn: Callable[[], Optional[str]]) -> 'Future[Optional[str]]':
+    """
+    Run a modal dialog on a dedicated single-threaded-apartment thread.
+
+    Keeps the caller's thread (and any event loop it drives) free while
+    the dialog is up, and gives the dialog its own explicit STA so it
+    never hangs against an ambient multithreaded apartment.
+
+    Args:
+        dialog_fn: Dialog function to invoke on the worker thread
+
+    Returns:
+        Future resolving to the selected path or None if cancelled
+    """
     if sys.platform != 'win32':
         raise RuntimeError("This application only works on Windows")
-    
-    try:
-        import tkinter as tk
-        from tkinter import filedialog
-        
-        # Create root window and hide it
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        
-        # Open folder dialog
-        folder_path = filedialog.askdirectory(
-            title="Select Output Folder",
-            initialdir=str(Path.home())
-        )
-        
-        # Destroy root window
-        root.destroy()
-        
-        return folder_path if folder_path else None
-        
-    except ImportError:
-        raise RuntimeError("tkinter is required for folder dialogs")
+
+    future: 'Future[Optional[str]]' = Future()
+
+    def worker() -> None:
+        try:
+            pythoncom = _load_win32()[0]
+            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+            try:
+                future.set_result(dialog_fn())
+            finally:
+                pythoncom.CoUninitialize()
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+
+def pick_csv_file_async() -> 'Future[Optional[str]]':
+    """
+    Open the CSV file picker without blocking the calling thread.
+
+    Returns:
+        Future resolving to the selected file path or None if cancelled
+    """
+    return _run_dialog(_pick_csv_file_dialog)
+
+
+def pick_folder_async() -> 'Future[Optional[str]]':
+    """
+    Open the folder picker without blocking the calling thread.
+
+    Returns:
+        Future resolving to the selected folder path or None if cancelled
+    """
+    return _run_dialog(_pick_folder_dialog)
+
+
+def pick_csv_file() -> Optional[str]:
+    """
+    Open Windows file picker for CSV file selection.
+
+    Returns:
+        Selected file path or None if cancelled
+    """
+    return pick_csv_file_async().result()
+
+
+def pick_folder() -> Optional[str]:
+    """
+    Open Windows folder picker for output directory selection.
+
+    Returns:
+        Selected folder path or None if cancelled
+    """
+    return pick_folder_async().result()
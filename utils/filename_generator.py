@@ -1,14 +1,134 @@
 """Filename generation utility with pattern-based naming and uniqueness handling."""
-import re
+import functools
+import operator
+import os
+import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import Iterable, Iterator, List, Dict, Any, Set, Tuple
 
 import config.naming_config
 
+# Translation table for filesystem sanitization: invalid Windows filename
+# characters become underscores, control characters are removed. A single
+# str.translate pass replaces two regex substitutions per component.
+_SANITIZE_TRANS = {ord(c): ord('_') for c in '<>:"/\\|?*'}
+_SANITIZE_TRANS.update({i: None for i in range(0x20)})
+_SANITIZE_TRANS[0x7f] = None
+
+# Characters that force a translate pass; most real values contain
+# none of them, so a C-level disjointness test skips the pass entirely
+_BAD_SET = frozenset('<>:"/\\|?*')
+
+
+@functools.lru_cache(maxsize=8)
+def _ignored_trans(chars: Tuple[str, ...]) -> Dict[int, None]:
+    """
+    Build (and cache) a deletion table for the ignored-characters config.
+
+    Keyed on the character tuple, so config changes produce a fresh table
+    while repeated calls with the same config reuse the cached one.
+
+    Args:
+        chars: Ignored characters as an immutable tuple
+
+    Returns:
+        Translation table deleting every ignored character
+    """
+    return str.maketrans('', '', ''.join(chars))
+
+
+@functools.lru_cache(maxsize=8)
+def _combined_trans(chars: Tuple[str, ...]) -> Dict[int, Any]:
+    """
+    Build (and cache) the fused cleaning + sanitization table.
+
+    Merges the filesystem sanitization mappings with deletions for the
+    ignored-characters config, so one translate pass replaces the
+    separate clean-then-sanitize traversals. Ignored characters win
+    over sanitize replacements, matching the original clean-first order.
+
+    Args:
+        chars: Ignored characters as an immutable tuple
+
+    Returns:
+        Combined translation table
+    """
+    table: Dict[int, Any] = dict(_SANITIZE_TRANS)
+    for c in chars:
+        table[ord(c)] = None
+    return table
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_and_sanitize(raw: str, chars: Tuple[str, ...]) -> str:
+    """
+    Run the fused cleaning pass over one raw value (memoized).
+
+    Category-like columns repeat the same values across many rows; the
+    cache turns repeats into a dict hit. The ignored-characters tuple
+    doubles as a table version: a config change produces new cache keys,
+    so stale entries are never served.
+
+    Args:
+        raw: Stripped raw value from the row
+        chars: Current ignored-characters signature
+
+    Returns:
+        Cleaned and sanitized filename component
+    """
+    return raw.translate(_combined_trans(chars)).strip('. ')
+
+
+@functools.lru_cache(maxsize=8192)
+def _sanitize_component(text: str) -> str:
+    """
+    Sanitize a single filename component (memoized).
+
+    Low-cardinality naming columns repeat the same raw values across many
+    rows; caching collapses N sanitizations into one per unique value.
+
+    Args:
+        text: Raw text to sanitize
+
+    Returns:
+        Sanitized text safe for use in filenames
+    """
+    if not text or not text.strip():
+        return ""
+
+    # Clean inputs dominate real datasets: if there are no invalid or
+    # control characters, skip the translate pass (isprintable rules
+    # out the control range in one C loop)
+    if text.isprintable() and _BAD_SET.isdisjoint(text):
+        return text.strip('. ')
+
+    # Replace invalid Windows filename characters and strip control
+    # characters in a single pass
+    sanitized = text.translate(_SANITIZE_TRANS)
+
+    # Trim whitespace and dots
+    return sanitized.strip('. ')
+
 
 class FilenameGenerator:
     """Generates unique filenames based on ordered key patterns."""
-    
+
+    # The per-row hot path is attribute-heavy; slots make each read a
+    # fixed-offset load and drop the per-instance __dict__
+    __slots__ = (
+        'naming_keys',
+        'output_directory',
+        'filename_counts',
+        '_fields_getter',
+        '_single_key',
+        '_max_base',
+        '_ignored_signature',
+        '_ignored_table',
+        '_combined_table',
+        '_existing_on_disk',
+    )
+
     def __init__(self, naming_keys: List[str], output_directory: Path):
         """
         Initialize filename generator.
@@ -29,11 +149,64 @@ class FilenameGenerator:
         if not output_directory.is_dir():
             raise ValueError(f"Output path is not a directory: {output_directory}")
         
-        self.naming_keys = naming_keys
+        # Interned keys match CSVParser's interned headers, so row
+        # lookups compare by pointer before falling back to hashing
+        self.naming_keys = [sys.intern(k) for k in naming_keys]
         self.output_directory = output_directory
-        self.generated_filenames: Set[str] = set()
-        self.filename_counts: Dict[str, int] = {}
+
+        # Base-name length budget: 255-char path limit minus the output
+        # directory, the .md extension, and room for a " - n" suffix,
+        # capped at the historical 200 and floored so degenerate paths
+        # still yield usable names
+        self._max_base = max(
+            40, min(200, 255 - len(str(output_directory)) - len('.md') - 8)
+        )
+
+        # Fetch all naming fields in one C-level call; itemgetter with a
+        # single key returns a scalar, so remember whether to re-wrap
+        self._fields_getter = operator.itemgetter(*self.naming_keys)
+        self._single_key = len(naming_keys) == 1
+        self.filename_counts: Dict[str, int] = defaultdict(int)
+
+        # Cache the ignored-characters deletion table on the instance,
+        # keyed by a signature of the config list so runtime config
+        # changes still take effect
+        self._ignored_signature = tuple(config.naming_config.IGNORED_CHARACTERS_FOR_NAMING)
+        self._ignored_table = _ignored_trans(self._ignored_signature)
+        self._combined_table = _combined_trans(self._ignored_signature)
+
+        # One-shot snapshot of markdown files already in the output
+        # directory; membership checks replace a stat syscall per
+        # candidate filename
+        self._existing_on_disk: Set[str] = self._scan_output_dir()
+
+    def _scan_output_dir(self) -> Set[str]:
+        """
+        List existing markdown basenames in the output directory.
+
+        Returns:
+            Set of filenames (without the .md extension) already on disk
+        """
+        # DirEntry type bits come back with the directory listing, so
+        # the is_file check costs no extra stat
+        with os.scandir(self.output_directory) as entries:
+            return {
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith('.md')
+                and entry.is_file(follow_symlinks=False)
+            }
     
+    def refresh_disk_cache(self) -> None:
+        """
+        Re-scan the output directory snapshot.
+
+        Call this if files were created or removed outside the
+        generator between batches; uniqueness checks otherwise rely on
+        the snapshot taken at construction.
+        """
+        self._existing_on_disk = self._scan_output_dir()
+
     def _clean_ignored_characters(self, text: str) -> str:
         """
         Remove ignored characters from text before filename generation.
@@ -50,37 +223,35 @@ class FilenameGenerator:
         """
         if not text:
             return text
-        
-        cleaned = text
-        # Access the config at runtime to pick up any dynamic changes
-        for char in config.naming_config.IGNORED_CHARACTERS_FOR_NAMING:
-            cleaned = cleaned.replace(char, '')
-        
-        return cleaned
-    
+
+        self._refresh_tables()
+        return text.translate(self._ignored_table)
+
+    def _refresh_tables(self) -> None:
+        """
+        Pick up runtime changes to the ignored-characters config.
+
+        Compares the config signature and swaps in fresh translation
+        tables only when it actually changed, so the common unchanged
+        case costs one tuple build and comparison.
+        """
+        signature = tuple(config.naming_config.IGNORED_CHARACTERS_FOR_NAMING)
+        if signature != self._ignored_signature:
+            self._ignored_signature = signature
+            self._ignored_table = _ignored_trans(signature)
+            self._combined_table = _combined_trans(signature)
+
     def _sanitize_filename_component(self, text: str) -> str:
         """
         Sanitize a single component of the filename.
-        
+
         Args:
             text: Raw text to sanitize
-            
+
         Returns:
             Sanitized text safe for use in filenames
         """
-        if not text or not text.strip():
-            return ""
-        
-        # Remove invalid Windows filename characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', text)
-        
-        # Remove control characters
-        sanitized = re.sub(r'[\x00-\x1f\x7f]', '', sanitized)
-        
-        # Trim whitespace and dots
-        sanitized = sanitized.strip('. ')
-        
-        return sanitized
+        return _sanitize_component(text)
     
     def _build_base_filename(self, row: Dict[str, Any]) -> str:
         """
@@ -92,32 +263,43 @@ class FilenameGenerator:
         Returns:
             Base filename constructed from naming key values
         """
-        filename_components = []
-        
-        # Extract values for each naming key in order
-        for key in self.naming_keys:
-            value = row.get(key, '').strip()
-            
-            if value:
-                # First, clean ignored characters (dynamic from config)
-                cleaned_value = self._clean_ignored_characters(value)
-                
-                # Then, sanitize for filesystem safety
-                sanitized_component = self._sanitize_filename_component(cleaned_value)
-                if sanitized_component:
-                    filename_components.append(sanitized_component)
-        
-        # Join components with separator
-        if filename_components:
+        # Grab all naming fields at once; fall back to per-key get()
+        # for rows missing one of the keys
+        try:
+            values = self._fields_getter(row)
+            if self._single_key:
+                values = (values,)
+        except KeyError:
+            values = tuple(row.get(key, '') for key in self.naming_keys)
+
+        # Clean and sanitize each value through the memoized fused pass,
+        # skipping values that are empty before or after cleaning
+        self._refresh_tables()
+        signature = self._ignored_signature
+        filename_components = [
+            component
+            for raw in values
+            if (value := raw.strip())
+            and (component := _clean_and_sanitize(value, signature))
+        ]
+
+        # Join components; one or two naming keys is the overwhelming
+        # case, so handle those without the general join
+        count = len(filename_components)
+        if count == 1:
+            base_filename = filename_components[0]
+        elif count == 2:
+            base_filename = f"{filename_components[0]} - {filename_components[1]}"
+        elif count:
             base_filename = ' - '.join(filename_components)
         else:
             # Fallback if all naming keys are empty
             base_filename = "unnamed"
-        
+
         # Limit total length to prevent filesystem issues
-        if len(base_filename) > 200:
-            base_filename = base_filename[:200].strip()
-        
+        if len(base_filename) > self._max_base:
+            base_filename = base_filename[:self._max_base].strip()
+
         return base_filename
     
     def _ensure_unique_filename(self, base_filename: str) -> str:
@@ -130,29 +312,64 @@ class FilenameGenerator:
         Returns:
             Unique filename (may have sequential number appended)
         """
-        # Check if this exact filename already exists in current session
-        if base_filename not in self.generated_filenames:
-            # Also check if file exists on disk
-            file_path = self.output_directory / f"{base_filename}.md"
-            if not file_path.exists():
-                self.generated_filenames.add(base_filename)
-                return base_filename
-        
-        # Filename exists, need to append number
-        if base_filename not in self.filename_counts:
-            self.filename_counts[base_filename] = 1
-        
-        # Find next available number
-        while True:
-            self.filename_counts[base_filename] += 1
-            numbered_filename = f"{base_filename} - {self.filename_counts[base_filename]}"
-            
-            # Check both in-memory tracking and filesystem
-            if numbered_filename not in self.generated_filenames:
-                file_path = self.output_directory / f"{numbered_filename}.md"
-                if not file_path.exists():
-                    self.generated_filenames.add(numbered_filename)
-                    return numbered_filename
+        # First-seen names are the overwhelming case: one membership
+        # test against the snapshot (which tracks session names too),
+        # one add, return — no counter dict touched
+        if base_filename not in self._existing_on_disk:
+            self._existing_on_disk.add(base_filename)
+            return base_filename
+
+        return self._collision_path(base_filename)
+
+    def _collision_path(self, base_filename: str) -> str:
+        """
+        Resolve a name collision with a numbered suffix (rare path).
+
+        Args:
+            base_filename: Base filename that already exists
+
+        Returns:
+            Unique numbered filename
+        """
+        # The counter holds the next free suffix for this base, so
+        # repeated collisions cost one dict lookup each. On the first
+        # collision, seed it past any "{base} - {n}" names already on
+        # disk.
+        n = self.filename_counts[base_filename] or self._seed_suffix(base_filename)
+
+        numbered_filename = f"{base_filename} - {n}"
+
+        # A literal "{base} - {n}" value in the data can still occupy
+        # the counter's slot; probe past it (rare)
+        while numbered_filename in self._existing_on_disk:
+            n += 1
+            numbered_filename = f"{base_filename} - {n}"
+
+        self.filename_counts[base_filename] = n + 1
+        self._existing_on_disk.add(numbered_filename)
+        return numbered_filename
+
+    def _seed_suffix(self, base_filename: str) -> int:
+        """
+        Find the starting suffix for a base name (first collision only).
+
+        Scans the disk snapshot for existing "{base} - {n}" names and
+        returns one past the highest, or 2 when none exist (suffixes
+        start at 2).
+
+        Args:
+            base_filename: Base filename without extension
+
+        Returns:
+            First suffix candidate for this base
+        """
+        prefix = f"{base_filename} - "
+        plen = len(prefix)
+        highest = 1
+        for name in self._existing_on_disk:
+            if name.startswith(prefix) and name[plen:].isdigit():
+                highest = max(highest, int(name[plen:]))
+        return highest + 1
     
     def generate_filename(self, row: Dict[str, Any], row_index: int = 0) -> str:
         """
@@ -174,10 +391,94 @@ class FilenameGenerator:
         unique_filename = self._ensure_unique_filename(base_filename)
         return unique_filename
     
+    def generate_filenames_bulk(self, rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Generate unique filenames for a whole batch of rows.
+
+        Equivalent to calling generate_filename per row, but with the
+        per-row lookups (naming keys, translate table, join) bound to
+        locals once for the batch instead of re-resolved each row.
+
+        Args:
+            rows: Iterable of data rows
+
+        Yields:
+            Complete unique filename per row, without extension
+        """
+        self._refresh_tables()
+        keys = self.naming_keys
+        signature = self._ignored_signature
+        clean = _clean_and_sanitize
+        join = ' - '.join
+        max_base = self._max_base
+        ensure_unique = self._ensure_unique_filename
+
+        for row_index, row in enumerate(rows):
+            get = row.get
+            parts = [
+                component
+                for key in keys
+                if (value := get(key, '').strip())
+                and (component := clean(value, signature))
+            ]
+            if parts:
+                base = join(parts)
+                if len(base) > max_base:
+                    base = base[:max_base].strip()
+            else:
+                base = f"unnamed_row_{row_index + 1}"
+            yield ensure_unique(base)
+
+    def generate_filenames_df(self, df: Any) -> Any:
+        """
+        Generate unique filenames for a pandas DataFrame of rows.
+
+        The per-value work (strip, fused translate, trim) runs as
+        vectorized Series operations over whole naming columns; only
+        the final join of non-empty components and the uniqueness pass
+        stay scalar, and both are O(1) per row.
+
+        Args:
+            df: DataFrame containing the naming-key columns
+
+        Returns:
+            pandas Series of unique filenames, aligned to df's index
+
+        Raises:
+            RuntimeError: If pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("pandas is required for generate_filenames_df")
+
+        self._refresh_tables()
+        table = self._combined_table
+        max_base = self._max_base
+        ensure_unique = self._ensure_unique_filename
+
+        # Clean each naming column in C-level Series passes
+        columns = [
+            df[key].fillna('').astype(str).str.strip()
+            .str.translate(table).str.strip('. ')
+            for key in self.naming_keys
+        ]
+
+        names = []
+        for row_index, parts in enumerate(zip(*(col.tolist() for col in columns))):
+            base = ' - '.join(p for p in parts if p)
+            if not base:
+                base = f"unnamed_row_{row_index + 1}"
+            elif len(base) > max_base:
+                base = base[:max_base].strip()
+            names.append(ensure_unique(base))
+
+        return pd.Series(names, index=df.index)
+
     def reset(self) -> None:
         """
         Reset internal state tracking.
         Useful if generating a new batch of files.
         """
-        self.generated_filenames.clear()
         self.filename_counts.clear()
+        self.refresh_disk_cache()